@@ -0,0 +1,59 @@
+# Encoding of button events sent to WebSocket clients
+import json
+import struct
+import time
+
+# Subprotocols offered during the WebSocket handshake, in order of preference
+SUBPROTOCOL_BINARY: str = "banananeopardy.bin.v1"
+SUBPROTOCOL_JSON: str = "banananeopardy.json"
+SUBPROTOCOLS: tuple[str, ...] = (SUBPROTOCOL_BINARY, SUBPROTOCOL_JSON)
+
+# Binary record layout (little endian, 8 bytes):
+#   uint8  event type
+#   uint8  button index (into BUTTONS)
+#   uint16 sequence number (wraps)
+#   uint32 timestamp in ms (time.ticks_ms)
+RECORD_FORMAT: str = "<BBHI"
+RECORD_SIZE: int = struct.calcsize(RECORD_FORMAT)
+
+# Event types
+EVENT_BUTTON: int = 1
+
+# Button indices used in binary records (must match game.html)
+BUTTONS: tuple[str, ...] = (
+    "player1",
+    "player2",
+    "player3",
+    "correct",
+    "incorrect",
+    "next_question",
+)
+
+# Sequence number of the next binary record
+_sequence: int = 0
+
+
+def encode_json(button_events: list[str]) -> str:
+    """Encodes button events as a JSON text frame"""
+    return json.dumps({"buttons": button_events})
+
+
+def encode_binary(button_events: list[str]) -> bytearray:
+    """Encodes button events as fixed-size binary records"""
+    global _sequence
+    timestamp = time.ticks_ms() & 0xFFFFFFFF
+    data = bytearray(RECORD_SIZE * len(button_events))
+    offset = 0
+    for name in button_events:
+        struct.pack_into(
+            RECORD_FORMAT,
+            data,
+            offset,
+            EVENT_BUTTON,
+            BUTTONS.index(name),
+            _sequence,
+            timestamp,
+        )
+        _sequence = (_sequence + 1) & 0xFFFF
+        offset += RECORD_SIZE
+    return data
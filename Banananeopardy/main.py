@@ -1,6 +1,5 @@
 # Async code inspired by Digikey youtube video: https://youtu.be/5VLvmA__2v0 and post: https://www.digikey.com/en/maker/projects/getting-started-with-asyncio-in-micropython-raspberry-pi-pico/110b4243a2f544b6af60411a85f0437c
 from uasyncio import sleep, run
-import json
 
 # Allow for connection to wireless
 from wireless import connectWireless
@@ -9,6 +8,15 @@ from secrets import SSID, PASS
 # Allow for GPIO access
 from gpio import get_button_events
 
+# Encoding of button events for clients
+from event_protocol import (
+    SUBPROTOCOLS,
+    SUBPROTOCOL_BINARY,
+    SUBPROTOCOL_JSON,
+    encode_binary,
+    encode_json,
+)
+
 import machine
 import sys
 
@@ -39,10 +47,13 @@ from ws_server import WebSocketServer, WebSocketClient
 
 
 class clientHandle(WebSocketClient):
-    def process(self, dataList):
+    def process(self, payloads):
         try:
-            # Send button data to client
-            self.connection.write(dataList)
+            # Send button data to client in its negotiated format (JSON by default)
+            payload = payloads.get(self.connection.protocol)
+            if payload is None:
+                payload = payloads[SUBPROTOCOL_JSON]
+            self.connection.write(payload)
         except ClientClosedError:
             self.connection.close()
 
@@ -50,12 +61,16 @@ class clientHandle(WebSocketClient):
 class AppServer(WebSocketServer):
     # Sets html to load and max connections allowed
     def __init__(self):
-        super().__init__("index.html", 10)
+        super().__init__("index.html", 10, SUBPROTOCOLS)
 
     # Creates a client on connection
     def _make_client(self, conn):
         return clientHandle(conn)
 
+    # Binary clients receive binary frames
+    def _is_binary_subprotocol(self, protocol):
+        return protocol == SUBPROTOCOL_BINARY
+
 # Failsafe
 # https://forums.raspberrypi.com/viewtopic.php?t=351934
 enable_21 = machine.Pin(21, machine.Pin.IN, machine.Pin.PULL_UP)
@@ -82,8 +97,12 @@ async def main():
 
         # Send button press events to all connected clients
         if button_events:
-            data = json.dumps({"buttons": button_events})
-            server.process_all(data)
+            # Encode once per format so every client sees the same sequence numbers
+            payloads = {
+                SUBPROTOCOL_BINARY: encode_binary(button_events),
+                SUBPROTOCOL_JSON: encode_json(button_events),
+            }
+            server.process_all(payloads)
             print(f"Buttons pressed: {button_events}")
 
 
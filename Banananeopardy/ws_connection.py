@@ -35,7 +35,7 @@ class ClientClosedError(Exception):
 
 
 class WebSocketConnection:
-    def __init__(self, addr, s, close_callback):
+    def __init__(self, addr, s, close_callback, protocol=None, binary=False):
         self.client_close = False
         self._need_check = False
 
@@ -43,6 +43,12 @@ class WebSocketConnection:
         self.socket = s
         self.ws = websocket(s, True)
         self.close_callback = close_callback
+        # Subprotocol negotiated during the handshake (None if not requested)
+        self.protocol = protocol
+
+        # Send binary frames instead of text frames (ioctl 9 sets frame opcode)
+        if binary:
+            self.ws.ioctl(9, 2)
 
         s.setblocking(False)
         s.setsockopt(socket.SOL_SOCKET, 20, self.notify)
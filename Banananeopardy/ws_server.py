@@ -48,11 +48,13 @@ class WebSocketClient:
 
 class WebSocketServer:
     # Initialization of new server
-    def __init__(self, page, max_connections=1):
+    def __init__(self, page, max_connections=1, subprotocols=()):
         self._listen_s = None
         self._clients = []
         self._max_connections = max_connections
         self._page = page
+        # Supported subprotocols in order of preference
+        self._subprotocols = subprotocols
 
     # Sets up the socket on the proper ip and port
     def _setup_conn(self, port, accept_handler):
@@ -90,6 +92,7 @@ class WebSocketServer:
         is_websocket = False
         request_path = '/'
         webkey = None
+        offered_protocols = []
         
         try:
             clr = cl.makefile("rwb", 0)
@@ -112,6 +115,10 @@ class WebSocketServer:
                         is_websocket = True
                     if h == b"Sec-WebSocket-Key":
                         webkey = v
+                    if h.lower() == b"sec-websocket-protocol":
+                        offered_protocols += [
+                            p.strip().decode() for p in v.split(b",")
+                        ]
         except:
             # Error reading request, close connection
             try:
@@ -131,10 +138,15 @@ class WebSocketServer:
                 d.update(b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11")
                 respkey = d.digest()
                 respkey = b2a_base64(respkey)[:-1]
+                protocol = self._select_subprotocol(offered_protocols)
                 
                 cl.send(b"HTTP/1.1 101 Switching Protocols\r\n")
                 cl.send(b"Upgrade: websocket\r\n")
                 cl.send(b"Connection: Upgrade\r\n")
+                if protocol:
+                    cl.send(b"Sec-WebSocket-Protocol: ")
+                    cl.send(protocol.encode())
+                    cl.send(b"\r\n")
                 cl.send(b"Sec-WebSocket-Accept: ")
                 cl.send(respkey)
                 cl.send(b"\r\n\r\n")
@@ -142,7 +154,13 @@ class WebSocketServer:
                 cl.settimeout(None)  # Remove timeout for websocket
                 self._clients.append(
                     self._make_client(
-                        WebSocketConnection(remote_addr, cl, self.remove_connection)
+                        WebSocketConnection(
+                            remote_addr,
+                            cl,
+                            self.remove_connection,
+                            protocol,
+                            self._is_binary_subprotocol(protocol),
+                        )
                     )
                 )
             except:
@@ -164,6 +182,17 @@ class WebSocketServer:
     def _make_client(self, conn):
         return WebSocketClient(conn)
 
+    # Pick the first supported subprotocol offered by the client (None if no match)
+    def _select_subprotocol(self, offered_protocols):
+        for protocol in self._subprotocols:
+            if protocol in offered_protocols:
+                return protocol
+        return None
+
+    # Whether the subprotocol sends binary frames (override in subclasses)
+    def _is_binary_subprotocol(self, protocol):
+        return False
+
 
 
     # Get content type based on file extension